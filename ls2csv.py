@@ -3,14 +3,32 @@
 """Custom version of `ls`.
 """
 from argparse import ArgumentParser
-from collections import namedtuple
+from collections import (
+    deque,
+    namedtuple,
+)
+from concurrent.futures import ThreadPoolExecutor
+from csv import writer as csv_writer
 from enum import (
     Enum,
     unique,
 )
-from errno import ENOENT
+from errno import (
+    ELOOP,
+    ENOENT,
+    ENOTDIR,
+)
+from functools import (
+    lru_cache,
+    partial,
+)
 from datetime import datetime
-from hashlib import md5
+from grp import getgrgid
+from hashlib import (
+    blake2b,
+    md5,
+    sha256,
+)
 from logging import (
     FileHandler,
     Formatter,
@@ -19,27 +37,36 @@ from logging import (
     StreamHandler,
 )
 from os import (
-    fsdecode,
     getcwd,
     getpid,
+    getxattr,
     readlink,
     scandir,
+    sep,
+    stat,
     strerror,
 )
 from os.path import (
-    getatime,
-    getctime,
-    getmtime,
+    abspath,
+    basename,
+    dirname,
     getsize,
+    isabs,
     isdir,
     isfile,
     islink,
     join,
     lexists,
+    realpath,
 )
+from operator import attrgetter
 from pathlib import Path
+from pwd import getpwuid
+from queue import Queue
 from random import uniform
 from re import (
+    ASCII,
+    DOTALL,
     compile as compile_,
     escape,
 )
@@ -53,20 +80,35 @@ from signal import (
     SIGTSTP,
     SIGUSR1,
     SIGUSR2,
+    SIG_BLOCK,
+    SIG_SETMASK,
+    pthread_sigmask,
     signal,
 )
-from subprocess import (
-    CalledProcessError,
-    PIPE,
-    run,
-    STDOUT,
+from stat import (
+    filemode,
+    S_IFDIR,
+    S_IFLNK,
+    S_IFMT,
+    S_IFREG,
+    S_ISLNK,
 )
 from sys import (
     argv,
     exit,
+    intern,
     stderr,
+    stdout,
+)
+from threading import (
+    Event,
+    Lock,
+    Thread,
+)
+from time import (
+    monotonic,
+    sleep,
 )
-from time import sleep
 
 
 # Constants  ----------------------------------------------------------------
@@ -77,81 +119,86 @@ LOGGER = getLogger(__name__)
 
 APP_RUN_INFOS = None
 
-DEFAULT_LOG_LEVEL = INFO
+# Pool of threads processing nodes, if more than one job is allowed, and
+# its submitted nodes not yet yielded (to cancel them when exiting)
+EXECUTOR = None
+PENDING_FUTURES = deque()
+
+# Limiter of files contents read for checksums, if a maximum rate is set
+RATE_LIMITER = None
+
+# Maximum number of walked nodes waiting to be written
+NODES_QUEUE_SIZE = 64
+
+# CSV output file, opened once for whole run, its writer, and its rows
+# still to be written
+OUTPUT_FILE = None
+OUTPUT_WRITER = None
+OUTPUT_ROWS = []
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Number of rows written, then flushed, at once in output
+OUTPUT_ROWS_BATCH_SIZE = 1024
 
-DEFAULT_CHECKSUM_ALGORITHM = "md5"
+DEFAULT_LOG_LEVEL = INFO
+# Logging formatters, for standard error and optional logfile
+STDERR_FORMATTER = Formatter(fmt='%(asctime)s %(levelname)s: %(message)s',
+                             datefmt="%H:%M:%S")
+LOGFILE_FORMATTER = Formatter(
+    fmt='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt="%Y-%m-%d %H:%M:%S")
+
+DEFAULT_CHECKSUM_ALGORITHM = "sha256"
 HASH_FUNCTIONS = {
+    # Fast on CPUs without SHA extensions; 128 bits are enough for
+    # contents comparison
+    'blake2b': partial(blake2b, digest_size=16),
     'md5': md5,
+    'sha256': sha256,
 }
-
-SIGNALS = {
-    SIGHUP:  "SIGHUP",
-    SIGINT:  "SIGINT",
-    #SIGKILL,  # cannot be caught blocked or ignored
-    SIGPROF: "SIGPROF",
-    #SIGSTOP,  # cannot be caught blocked or ignored
-    SIGTERM: "SIGTERM",
-    SIGTSTP: "SIGTSTP",
-    SIGUSR1: "SIGUSR1",
-    SIGUSR2: "SIGUSR2",
-}
-
-# `ls` command and options:
-#
-# -A:   id. --all but skip `.` and `..`
-# -l:   long, detailled output
-# -1:   list one file per line
-# -s    print the allocated size of each file, in blocks
-# #-h:   size in human readable
-# #-p:   append `/` indicator to directories  # NO: with -Q results in ``"dir"/``
-# -Q:   enclose entry names in double quotes
-# -Z:   print any security context of each file
-#LS = "ls -A -l --full-time -s -1 -Q -Z \"{path}\""
-LS = "ls -A -l -Q -Z --time-style=long-iso \"{path}\""
-# Same but for directory
-#LSD = "ls -A -l --full-time -s -1 -Q -Z -d \"{path}\""
-LSD = "ls -A -l -Q -Z --time-style=long-iso -d \"{path}\""
-
-LS_OUTPUT_REGEX = compile_(''
-    r'^'
-    # Type
-    r'(?P<p_type>[-ldrMnpscbD?]{1})'
-    # Permissions
-    r'(?P<p_perms>((r|-)(w|-)(x|X|s|t|S|T|-)){3})'
-    r'\s+'
-    # Links number
-    r'(?P<links_nb>\d+)'
-    r'\s+'
-    # User owner
-    r'(?P<user_owner>[a-zA-Z][a-zA-Z0-9_]*)'
-    r'\s+'
-    # Group owner
-    r'(?P<group_owner>[a-zA-Z][a-zA-Z0-9_]*)'
-    r'\s+'
-    # Security
-    r'(?P<security>\S+)'
-    r'\s+'
-    # Size
-    r'(?P<size>\d+)'
-    r'\s+'
-    # ISO day date
-    r'(?P<iso_date>\d{4}-\d{2}-\d{2})'
-    r'\s+'
-    # ISO time
-    r'(?P<iso_time>\d{2}:\d{2})'
-    r'\s+'
-    # path
-    r'\"(?P<path>[^"]+)\"'
-    # optional link
-    r'('
-        r'\s+'
-        r'(-[>>]{1})'
-        r'\s+'
-        r'\"(?P<symlink>[^"]+)\"'
-    r')?'
-    r'$'
+# Size of chunks of files content read for computing their checksum
+CHECKSUM_CHUNK_SIZE = 1 << 18
+
+# Signals terminating application run, as (number, name) pairs
+SIGNALS = (
+    (SIGHUP,  "SIGHUP"),
+    (SIGINT,  "SIGINT"),
+    #(SIGKILL, "SIGKILL"),  # cannot be caught blocked or ignored
+    (SIGPROF, "SIGPROF"),
+    #(SIGSTOP, "SIGSTOP"),  # cannot be caught blocked or ignored
+    (SIGTERM, "SIGTERM"),
+    (SIGTSTP, "SIGTSTP"),
+    (SIGUSR1, "SIGUSR1"),
+    (SIGUSR2, "SIGUSR2"),
 )
 
+# Maximum number of sym.links' linked paths infos kept in cache
+LINKED_PATHES_CACHE_SIZE = 65536
+
+# Caches of users and groups names, by their ids
+USER_NAMES = {}
+GROUP_NAMES = {}
+
+# Extended attribute storing SELinux security context, as shown by `ls -Z`
+SECURITY_XATTR = "security.selinux"
+
+# Format of time in `ls -l --time-style=long-iso` output
+LS_TIME_FORMAT = "%Y-%m-%d %H:%M"
+# Escapes of `ls -Q` quoted names: C escapes for usual control characters,
+# octal ones for others
+LS_QUOTE_ESCAPES = {code: f"\\{code:03o}"
+                    for code in (*range(0x20), 0x7f)}
+LS_QUOTE_ESCAPES.update({
+    ord('\a'): "\\a",
+    ord('\b'): "\\b",
+    ord('\t'): "\\t",
+    ord('\n'): "\\n",
+    ord('\v'): "\\v",
+    ord('\f'): "\\f",
+    ord('\r'): "\\r",
+    ord('"'): '\\"',
+    ord('\\'): "\\\\",
+})
+
 # AlwaysData locale, as defined:
 #
 #   $ locale
@@ -172,6 +219,12 @@ LS_OUTPUT_REGEX = compile_(''
 #   LC_ALL=
 ENCODING="utf-8"
 
+# Error message templates, only formatted when error actually occurs
+NOT_EXISTING_PATH_ERROR_MSG = (
+    "Path ``{path}`` seems to either not exist (any more) or user who "
+    "launch application has not enough rights to ask for more "
+    "information about node!")
+
 DEFAULT_EXCLUDED = [
     r".cache/",
     r".composer/",
@@ -182,6 +235,8 @@ DEFAULT_EXCLUDED = [
 DEFAULT_MIN_TIME_SLEEP = 0.25
 DEFAULT_MAX_TIME_SLEEP = 0.35
 
+DEFAULT_JOBS = 1
+
 
 # Classes  ------------------------------------------------------------------
 
@@ -194,13 +249,13 @@ class NodeType(Enum):
     unknown = 4
     excluded = 5
 
-    def as_ls_output_char(self):
-        equivalence = {
-            NodeType.file: "-",
-            NodeType.directory: "d",
-            NodeType.symlink: "l"
-        }
-        return equivalence.get(self, "?")
+
+# Node types, by file type bits of a `st_mode` (as returned by `stat.S_IFMT()`)
+NODE_TYPES_BY_FMT = {
+    S_IFDIR: NodeType.directory,
+    S_IFREG: NodeType.file,
+    S_IFLNK: NodeType.symlink,
+}
 
 
 @unique
@@ -214,6 +269,14 @@ class SymLinkType(Enum):
     circular = 6
 
 
+# Sym.link types, by file type bits of a linked path's `st_mode`
+SYMLINK_TYPES_BY_FMT = {
+    S_IFDIR: SymLinkType.directory,
+    S_IFREG: SymLinkType.file,
+    S_IFLNK: SymLinkType.symlink,
+}
+
+
 @unique
 class OwnerType(Enum):
     user = 1
@@ -229,35 +292,17 @@ DirEntries = namedtuple('DirEntries', (
     'unknowns'))
 
 
-class Result:
-    """Container for either a value (result of function call) or an error.
-    """
-    def __init__(self, value=None, error_msg=None):
-        self._value = value
-        self._error_msg = error_msg
-
-    @property
-    def value(self):
-        return self._value
-
-    @property
-    def error_msg(self):
-        return self._error_msg
-
-    def has_value(self):
-        return self._value is not None
-
-    def has_error(self):
-        return self._error_msg is not None
-
-
 class DirEntry:
     """Wrapper class around :class:`os.DirEntry`.
     """
-    def __init__(self, parent_dirpath, entry, options, type_=None):
-        self._path = parent_dirpath / fsdecode(entry.name)
+    __slots__ = ('_path', '_entry', '_stat', '_type')
+
+    def __init__(self, entry, type_=None):
+        # Path is kept as a `str`, as already built by `os.scandir()`
+        self._path = entry.path
         self._entry = entry
-        self.set_type(options, type_)
+        self._stat = None
+        self.set_type(type_)
 
     @property
     def path(self):
@@ -266,6 +311,20 @@ class DirEntry:
     def is_path_existing(self):
         return lexists(self._path)
 
+    def stat(self):
+        """Get status of entry, without following it if a sym.link.
+
+        Result is cached, as retrieved once when inferring entry's type.
+
+        Raises
+        ------
+        `OSError`
+            If status could not be retrieved.
+        """
+        if self._stat is None:
+            self._stat = self._entry.stat(follow_symlinks=False)
+        return self._stat
+
     @property
     def name(self):
         return self._entry.name
@@ -281,32 +340,21 @@ class DirEntry:
         # else: default: unknown
         return NodeType.unknown
 
-    def set_type(self, options, type_=None):
-        # Test if node's path must be excluded
-        if options.is_path_excluded(self._path):
-            self._type = NodeType.excluded
-            return
-        # else:
-
+    def set_type(self, type_=None):
         # Set type if any
         if type_:
             self._type = type_
             return
         # else:
 
-        # Try inferring type from dir_entry
-        dir_entry = self._entry
+        # Try inferring type from dir_entry's file type bits, with one
+        # `lstat()` which result is kept for any later use
         try:
-            if dir_entry.is_symlink():
-                type_ = NodeType.symlink
-            elif dir_entry.is_dir(follow_symlinks=False):
-                type_ = NodeType.directory
-            elif dir_entry.is_file(follow_symlinks=False):
-                type_ = NodeType.file
-            else:
-                type_ = NodeType.unknown
+            mode = self.stat().st_mode
         except OSError as error:
             type_ = NodeType.unknown
+        else:
+            type_ = NODE_TYPES_BY_FMT.get(S_IFMT(mode), NodeType.unknown)
 
         self._type = type_
 
@@ -358,7 +406,10 @@ class DirEntry:
             with scandir(parent_dirpath) as dir_entries:
                 for dir_entry in dir_entries:
                     if dir_entry.name == name:
-                        return cls(parent_dirpath, dir_entry, options)
+                        type_ = NodeType.excluded \
+                            if options.is_path_excluded(dir_entry.path) \
+                            else None
+                        return cls(dir_entry, type_)
                 not_found = True
         except OSError as error:
             LOGGER.error((
@@ -382,6 +433,8 @@ class DirEntry:
 class SymLink:
     """Container for symbolic link infos.
     """
+    __slots__ = ('_type', '_linked_path', '_resolved_linked_path')
+
     def __init__(self, type_, linked_path=None, resolved_linked_path=None):
         self._type = type_
         self._linked_path = linked_path
@@ -412,14 +465,14 @@ class SymLink:
     @property
     def linked_path(self):
         if self._linked_path:
-            Path(self._linked_path)
+            return Path(self._linked_path)
         # else:
         return None
 
     @property
     def resolved_linked_path(self):
         if self._resolved_linked_path:
-            Path(self._resolved_linked_path)
+            return Path(self._resolved_linked_path)
         # else:
         return None
 
@@ -427,6 +480,8 @@ class SymLink:
 class Size:
     """Size of a filesystem node.
     """
+    __slots__ = ('_value', '_unit_idx', '_unit')
+
     UNITS = ['b', 'Kb', 'Mb', 'Gb', 'Tb']
 
     def __init__(self, value, unit=None):
@@ -442,11 +497,7 @@ class Size:
         """
         self._value = value
         unit = self.UNITS[0] if (unit is None) else unit
-        if unit not in self.UNITS:
-            error_msg = (""
-                f"Unit of size must belong to `Size.UNITS`, and be one of "
-                f"``{self.UNITS}``; parameter was set to ``'{unit}'``!")
-            raise ValueError(error_msg)
+        self._unit_idx = self._get_unit_index(unit)
         self._unit = unit
 
     @property
@@ -457,6 +508,23 @@ class Size:
     def unit(self):
         return self._unit
 
+    @classmethod
+    def _get_unit_index(cls, unit):
+        """Get index of a unit into `.UNITS`, i.e. its power of 1024.
+
+        Raises
+        ------
+        `ValueError`
+            If :param:`unit` is not one of `.UNITS`.
+        """
+        try:
+            return cls.UNITS.index(unit)
+        except ValueError:
+            error_msg = (""
+                f"Unit of size must belong to `Size.UNITS`, and be one of "
+                f"``{cls.UNITS}``; parameter was set to ``'{unit}'``!")
+            raise ValueError(error_msg) from None
+
     def convert_to(self, unit=None):
         """Convert a given size in bytes into either human or in a given unit.
 
@@ -472,47 +540,56 @@ class Size:
         `str`
             Size object representation into :param:`unit` unit.
         """
-        if unit not in (self.UNITS[:] + [None]):
-            error_msg = (""
-                f"Unit of size must belong to `Size.UNITS`, and be one of "
-                f"``{self.UNITS}``; parameter was set to ``'{unit}'``!")
-            raise ValueError(error_msg)
-
-        divisor = 1024
-
-        if (unit == self.unit) or \
-                ((unit is None) and (self.unit == 'b') and (self.value < divisor)):
-            return f"{self.value} {self.unit}"
+        # Size in bytes, from which select target unit directly by its
+        # number of bits (each unit being 2**10 times previous one)
+        value = self._value << (10 * self._unit_idx)
+        if unit is None:
+            unit_idx = min(max(value.bit_length() - 1, 0) // 10,
+                           len(self.UNITS) - 1)
+        else:
+            unit_idx = self._get_unit_index(unit)
 
-        dividend = self.value
-        for exp, _unit in enumerate(self.UNITS[1:], start=1):
-            _size = float(dividend) / float(divisor)
-            if (_unit == self.unit) or ((unit is None) and (_size < divisor)):
-                return f"{_size:.1f} {_unit}"
-            dividend = _size
+        if unit_idx == self._unit_idx:
+            return f"{self._value} {self._unit}"
+        # else:
 
-        return f"{_size:.1f} {_unit}"
+        return f"{value / (1 << (10 * unit_idx)):.1f} {self.UNITS[unit_idx]}"
 
 
 class NodeInfos:
     """Metadata about a filesystem node.
     """
+    # One instance per walked node: avoid a per-instance `__dict__`
+    __slots__ = (
+        '_path', '_type', '_links_nb', '_size',
+        '_perms', '_user_owner', '_group_owner', '_security',
+        '_atime', '_mtime', '_ctime',
+        '_symlink_type', '_symlink_value', '_resolved_symlink_path',
+        '_checksums', '_error_msgs', '_ls_output',
+    )
+
     def __init__(self, path, type_,
                  links_nb=None, size=None,
                  perms=None, user_owner=None, group_owner=None, security=None,
                  atime=None, mtime=None, ctime=None,
                  symlink_type=None, symlink_value=None, resolved_symlink_path=None,
                  checksums=None, error_msgs=None, ls_output=None):
-        self._path = Path(path) if isinstance(path, str) else path
+        # Path is kept as a `str`, only converted as `Path` on demand
+        self._path = None if (path is None) else str(path)
         self._type = type_
         self._links_nb = links_nb
         if isinstance(size, int):
             size = Size(size)
         self._size = size
-        self._perms = perms
-        self._user_owner = user_owner
-        self._group_owner = group_owner
-        self._security = security
+        # Permissions, owners and security context are mostly shared by many
+        # nodes: intern them to keep only one copy of each
+        self._perms = intern(perms) if isinstance(perms, str) else perms
+        self._user_owner = \
+            intern(user_owner) if isinstance(user_owner, str) else user_owner
+        self._group_owner = \
+            intern(group_owner) if isinstance(group_owner, str) else group_owner
+        self._security = \
+            intern(security) if isinstance(security, str) else security
         self._atime = None
         if atime:
             if isinstance(atime, float):
@@ -547,7 +624,7 @@ class NodeInfos:
             if isinstance(error_msgs, str):
                 self._error_msgs.append(error_msgs)
             else:  # assume iterable
-                self._error_msgs.extend([msg for msg in error_msgs])
+                self._error_msgs.extend(error_msgs)
         self._ls_output = ls_output
 
     @property
@@ -564,11 +641,7 @@ class NodeInfos:
         if relative_to is None:
             return self.path
         # else:
-        try:
-            _path = self._path.relative_to(relative_to)
-        except ValueError as error:
-            _path = self._path
-        return str(_path)
+        return get_relative_path(self._path, relative_to)
 
     def is_path_existing(self):
         return lexists(self._path)
@@ -782,8 +855,10 @@ class NodeInfos:
         return self._ls_output
 
     @staticmethod
-    def colstocsv():
-        return tocsv([
+    def columns(checksum_algorithm=None):
+        checksum_col = "Checksum" if (checksum_algorithm is None) \
+                                  else f"{checksum_algorithm.upper()} checksum"
+        return [
             "Path",
             "Type",
             "Has error(s)",
@@ -803,15 +878,16 @@ class NodeInfos:
             "Sym.link value",
             "Type of sym.link",
             "Fully resolved sym.link path",
-            "MD5 checksum",
+            checksum_col,
             "Error message(s)",
-            "Unparsed 'ls' output",
-        ])
+            "'ls -l -Q -Z' like output",
+        ]
 
-    def tocsv(self, pathes_relative_to=None):
-        return tocsv([
+    def to_row(self, pathes_relative_to=None, checksum_algorithm=None):
+        symlink_type = self.symlink_type
+        return [
             self.get_path(relative_to=pathes_relative_to),
-            self.type,
+            self.type.name,
             None if (not self.has_error()) else "ERROR",
             self.links_nb,
             self.size_value,
@@ -827,29 +903,88 @@ class NodeInfos:
             self.ctime_as_timestamp,
             self.ctime_as_isoformat,
             self.get_symlink_value(relative_to=pathes_relative_to),
-            self.symlink_type,
+            None if (symlink_type is None) else symlink_type.name,
             self.resolved_symlink_path,
-            self.get_checksum('md5'),
+            self.get_checksum(checksum_algorithm),
             self.error_msgs,
             self.ls_output,
-        ])
+        ]
+
+
+class RateLimiter:
+    """Token bucket limiting a rate of bytes, shared by all threads.
+
+    Up to one second of bytes can be consumed at once; beyond, consumers
+    wait until enough tokens are available again, or until limiter is
+    stopped.
+    """
+    __slots__ = ('_rate', '_tokens', '_last_time', '_lock', '_stop_event')
+
+    def __init__(self, rate):
+        """Initialize a new rate limiter.
+
+        Arguments
+        ---------
+        rate : `float`
+            Maximum rate, in bytes per second.
+        """
+        self._rate = rate
+        self._tokens = rate
+        self._last_time = monotonic()
+        self._lock = Lock()
+        self._stop_event = Event()
+
+    @property
+    def rate(self):
+        return self._rate
+
+    def consume(self, bytes_nb):
+        """Consume some bytes, waiting if rate is exceeded.
+
+        Arguments
+        ---------
+        bytes_nb : `int`
+            Number of bytes to consume.
+        """
+        # Tokens debt is shared by all threads, so that all together never
+        # exceed rate; but each one waits without holding lock
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self._rate,
+                self._tokens + (now - self._last_time) * self._rate)
+            self._tokens -= bytes_nb
+            self._last_time = now
+            waiting_time = -self._tokens / self._rate
+        if waiting_time > 0:
+            self._stop_event.wait(waiting_time)
+
+    def stop(self):
+        """Stop limiting rate, waking up any waiting consumer.
+        """
+        self._stop_event.set()
 
 
 class AppRunInfos:
     """Set of informations about current application run.
     """
     def __init__(self):
-        self._script_path = Path(argv[0]).resolve(strict=True)
-        self._working_dirpath = Path(getcwd()).resolve(strict=True)
+        # Resolved paths are only computed on first access
+        self._script_path = None
+        self._working_dirpath = None
         self._pid = getpid()
         self._start_datetime = datetime.now()
 
     @property
     def script_path(self):
+        if self._script_path is None:
+            self._script_path = Path(argv[0]).resolve(strict=True)
         return self._script_path
 
     @property
     def working_dirpath(self):
+        if self._working_dirpath is None:
+            self._working_dirpath = Path(getcwd()).resolve(strict=True)
         return self._working_dirpath
 
     @property
@@ -871,19 +1006,41 @@ class Options:
     def __init__(self, parsed_cli_args, walked_pathes,
                  min_sleep_time=None, max_sleep_time=None,
                  pathes_relative_to=None, output_path=None, logfile_path=None,
-                 excluded=None, excluded_relative_to=None, checksum=None):
+                 excluded=None, excluded_relative_to=None, checksum=None,
+                 ls_output=False, jobs=DEFAULT_JOBS, max_mbps=None):
         self._parsed_cli_args = parsed_cli_args
         self._walked_pathes = list(walked_pathes)
         self._min_sleep_time = min_sleep_time
         self._max_sleep_time = max_sleep_time
+        # Do not even draw a sleep time if interval is ``[0, 0]``
+        self._is_sleep_enabled = bool(min_sleep_time) or bool(max_sleep_time)
         self._pathes_relative_to = pathes_relative_to
         self._output_path = output_path
         self._logfile_path = logfile_path
+        # Exact excluded paths are looked up in a set, others are regexp.,
+        # all combined in a single one, only tried on paths starting with
+        # any of their prefixes
+        self._excluded_pathes = set()
         self._excluded = []
-        if excluded:
-            self._excluded.extend([exclude for exclude in excluded])
+        excluded_prefixes = []
+        for exclude in (excluded or ()):
+            if isinstance(exclude, str):
+                self._excluded_pathes.add(exclude)
+            else:
+                prefix, regex = exclude
+                excluded_prefixes.append(prefix)
+                self._excluded.append(regex)
+        self._excluded_prefixes = tuple(excluded_prefixes)
+        self._excluded_dirs_regex = None
+        if self._excluded:
+            self._excluded_dirs_regex = compile_(
+                "|".join(f"(?:{regex.pattern})" for regex in self._excluded),
+                ASCII | DOTALL)
         self._excluded_relative_to = excluded_relative_to
         self._checksum = checksum
+        self._ls_output = ls_output
+        self._jobs = jobs
+        self._max_mbps = max_mbps
 
     @property
     def parsed_cli_args(self):
@@ -901,6 +1058,10 @@ class Options:
     def max_sleep_time(self):
         return self._max_sleep_time
 
+    @property
+    def is_sleep_enabled(self):
+        return self._is_sleep_enabled
+
     @property
     def pathes_relative_to(self):
         return self._pathes_relative_to
@@ -917,9 +1078,13 @@ class Options:
     def excluded_regex(self):
         return self._excluded[:]
 
+    @property
+    def excluded_pathes(self):
+        return sorted(self._excluded_pathes)
+
     @property
     def excluded_patterns(self):
-        return [regex.pattern for regex in self._excluded]
+        return tuple(regex.pattern for regex in self._excluded)
 
     @property
     def excluded_relative_to(self):
@@ -929,6 +1094,18 @@ class Options:
     def checksum(self):
         return self._checksum
 
+    @property
+    def ls_output(self):
+        return self._ls_output
+
+    @property
+    def jobs(self):
+        return self._jobs
+
+    @property
+    def max_mbps(self):
+        return self._max_mbps
+
     def get_path(self, path):
         """Get a filesystem path in a form respecting `pathes_relative_to`
         setting.
@@ -947,7 +1124,7 @@ class Options:
         if self._pathes_relative_to is None:
             return Path(path)
         # else:
-        return path.relative_to(self.pathes_relative_to)
+        return Path(get_relative_path(path, self._pathes_relative_to))
 
     def get_random_sleep_time(self):
         """Get random sleep time, regarding interval defined by `min_sleep_time`
@@ -961,7 +1138,8 @@ class Options:
         return uniform(self.min_sleep_time, self.max_sleep_time)
 
     def is_path_excluded(self, path):
-        """Tell if a given path match any of all regex patterns.
+        """Tell if a given path is one of excluded ones, or match any of all
+        regex patterns.
 
         Arguments
         ---------
@@ -971,70 +1149,107 @@ class Options:
         Returns
         -------
         `bool`
-            ``True`` if at least one pattern in :param:`regex_patterns`
-            *matches* :param:`path`; ``False`` otherwise (if none pattern
-            match path).
+            ``True`` if :param:`path` is one of `excluded_pathes` or if at
+            least one pattern in `excluded_regex` *fully matches* it;
+            ``False`` otherwise (if none pattern match path).
         """
         path = str(path)
-        for pattern in self._excluded:
-            match = pattern.match(path)
-            if match:
-                return True
-        return False
+        if path in self._excluded_pathes:
+            return True
+        # else:
+        if (self._excluded_dirs_regex is None) \
+                or (not path.startswith(self._excluded_prefixes)):
+            return False
+        # else:
+        return self._excluded_dirs_regex.fullmatch(path) is not None
 
 
-# CSV Functions  ------------------------------------------------------------
+# Paths Functions  ----------------------------------------------------------
 
-def csv_escape(string_value):
-    """Escape a string value for CSV encoding.
+def get_relative_path(path, relative_to):
+    """Get a path relative to another one, if it is one of its descendants.
 
     Arguments
     ---------
-    string_value : `str`
-        String value to escape for its encoding into CSV.
+    path : `str` or `pathlib.Path`
+        Absolute path to make relative.
+    relative_to : `str` or `pathlib.Path`
+        Absolute path to which :param:`path` has to be relative.
 
     Returns
     -------
     `str`
-        Escaped translation of :param:`string_value`.
+        :param:`path` relative to :param:`relative_to` if it is one of its
+        descendants (or ``'.'`` if it is the same path); :param:`path`
+        unchanged otherwise.
     """
-    return string_value.translate({
-                '"': '""',
-                })
+    path = str(path)
+    root = str(relative_to).rstrip(sep)
+    if path == root:
+        return "."
+    # else:
+    root += sep
+    if path.startswith(root):
+        return path[len(root):]
+    # else:
+    return path
 
 
-def tocsv(row):
-    """Convert a list of values into a CSV row.
+# CSV Functions  ------------------------------------------------------------
+
+def new_csv_writer(file_):
+    """Create a CSV writer on given output file.
 
     Arguments
     ---------
-    row : `iterable`
-        List of cell values to transform into CSV.
+    file_ : file object
+        Output file, as opened by :func:`open_output_file`.
 
     Returns
-    `str`
-        CSV row.
+    -------
+    CSV writer object
+        Writer of rows at end of :param:`file_`, each ended by a single
+        newline character.
     """
-    _row = []
-    for item in row:
-        if item is None:
-            _row.append("")
-        elif isinstance(item, Enum):
-            _row.append(f'"{item.name}"')
-        elif isinstance(item, (int, float, bool)):
-            _row.append(str(item))
-        else:
-            item = csv_escape(str(item))
-            _row.append(f'"{item}"' if (len(item) > 0) else "")
+    return csv_writer(file_, lineterminator="\n")
 
-    return ",".join(_row)
+
+def write_rows(writer, rows):
+    """Write new CSV rows with given values, all at once.
+
+    Arguments
+    ---------
+    writer : CSV writer object
+        Writer, as created by :func:`new_csv_writer`, through which
+        append rows.
+    rows : `list` of `list`
+        Rows of cells values to append; ``None`` values are written as
+        empty cells.
+
+    Returns
+    -------
+    `str` or ``None``
+        Error message, if function call encountered some error.
+    """
+    try:
+        writer.writerows(rows)
+    except OSError as error:
+        error_msg = (
+            f"Unable to write new rows in output; got following error: "
+            f"{error.strerror}")
+        LOGGER.critical(error_msg)
+        return error_msg
+
+    return None
 
 
 # Files-related Functions  --------------------------------------------------
 
-def read_file_content(path):
-    """Read a file content.
+def file_checksum(path, algorithm=DEFAULT_CHECKSUM_ALGORITHM):
+    """Get a checksum hash hexadecimal digest from a file content.
 
+    File content is streamed by chunks into hash computation, through
+    a single reused buffer, rather than being fully loaded in memory.
     If an error is encountered during file opening or content reading,
     `OSError` is catched and not propagated.
 
@@ -1042,88 +1257,231 @@ def read_file_content(path):
     ---------
     path : `str`
         File path from which try reading content.
+    algorithm : `str`
+        Algorithm to use on file's content to generage checksum.
 
     Returns
     -------
-    :class:`Result`
-        Always, reading content wins or errs.
+    `tuple` of (`str`, `str`)
+        Always, reading content wins or errs: hexadecimal hash as checksum
+        of file content through :param:`algorithm` computation (or ``None``)
+        and error message (or ``None``).
     """
-    content, error_msg = (None,) * 2
+    hash_ = (HASH_FUNCTIONS[algorithm])()
+    buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+    view = memoryview(buffer)
 
     try:
-        with open(path, mode='rb') as file_:
-            content = file_.read()
+        with open(path, mode='rb', buffering=0) as file_:
+            size = file_.readinto(buffer)
+            while size:
+                hash_.update(view[:size])
+                size = file_.readinto(buffer)
     except OSError as error:
         error_msg = \
             f"Unable to open and read ``{path}`` file: {error.strerror}"
+        return None, error_msg
 
-    return Result(content, error_msg)
+    return hash_.hexdigest(), None
 
 
-def checksum(content, algorithm=DEFAULT_CHECKSUM_ALGORITHM):
-    """Get a checksum hash hexadecimal digest from some content.
+def open_output_file(filepath=None, encoding=None):
+    """Open output file, once for all lines to be written into it.
 
     Arguments
     ---------
-    content : `binary`
-        Some content from which compute checksum.
-    algorithm : `str`
-        Algorithm to use on node's content to generage checksum.
+    filepath : `str`
+        Filepath into which append content; if set to ``None``, output
+        will be `sys.stdout`.
+    encoding : `str`
+        Encoding of :param:`file` if not `sys.stdout`.
 
     Returns
     -------
-    `str`
-        Hexadecimal hash as checksum of :param:`content` through
-        :param:`algorithm` computation.
+    `tuple` of (file object, `str`)
+        Opened output file (or ``None``) and error message encountered
+        opening it (or ``None``).
     """
-    hash_ = (HASH_FUNCTIONS[algorithm])()
-    hash_.update(content)
+    if filepath is None:
+        return stdout, None
+    #else:
+
+    try:
+        file_ = open(filepath, mode='at', encoding=encoding, newline='',
+                     buffering=OUTPUT_BUFFER_SIZE)
+    except OSError as error:
+        error_msg = (
+            f"Unable to open `{filepath}` for writing; got following error: "
+            f"{error.strerror}")
+        LOGGER.critical(error_msg)
+        return None, error_msg
 
-    return hash_.hexdigest()
+    return file_, None
 
 
-def write_new_line(filepath=None, encoding=None, content=None):
-    """Write new line with content at end of given file.
+def flush_output_file(file_):
+    """Flush output file buffered content.
 
     Arguments
     ---------
-    filepath : `str`
-        Filepath into which append content; if set to ``None``, output
-        will be `sys.stdout`.
-    encoding : `str`
-        Encoding of :param:`file` if not `sys.stdout`.
-    content : `str`
-        Content to append as new line in :param:`file`.
+    file_ : file object
+        Output file, as opened by :func:`open_output_file`.
 
     Returns
     -------
-    :class:`Result`
-        Container indicating if function call encountered some error.
+    `str` or ``None``
+        Error message, if function call encountered some error.
     """
-    if content is None:
-        return Result(True)
-    #else:
-
-    if filepath is None:
-        print(content)
-        return Result(True)
-    #else:
-
     try:
-        with open(filepath, mode='at', encoding=encoding) as file_:
-            file_.write(content + "\n")
+        file_.flush()
     except OSError as error:
         error_msg = (
-            f"Unable to write at end of `{filepath}`; got following error: "
+            f"Unable to flush `{file_.name}`; got following error: "
             f"{error.strerror}")
         LOGGER.critical(error_msg)
-        return Result(error_msg=error_msg)
+        return error_msg
+
+    return None
+
 
-    return Result(True)
+def close_output_file(file_):
+    """Flush and close output file, unless it is `sys.stdout`.
+
+    Arguments
+    ---------
+    file_ : file object
+        Output file, as opened by :func:`open_output_file`.
+    """
+    try:
+        file_.flush()
+        if file_ is not stdout:
+            file_.close()
+    except OSError as error:
+        LOGGER.critical((f"Unable to flush and close `{file_.name}`; got "
+                         f"following error: {error.strerror}"))
 
 
 # Nodes scanning Functions  -------------------------------------------------
 
+def get_user_name(uid):
+    """Get name of a user from its id., or id. itself if user is unknown.
+
+    Arguments
+    ---------
+    uid : `int`
+        User id.
+
+    Returns
+    -------
+    `str`
+        User name, as shown by `ls -l`.
+    """
+    name = USER_NAMES.get(uid)
+    if name is None:
+        try:
+            name = getpwuid(uid).pw_name
+        except KeyError as error:
+            name = str(uid)
+        USER_NAMES[uid] = name
+    return name
+
+
+def get_group_name(gid):
+    """Get name of a group from its id., or id. itself if group is unknown.
+
+    Arguments
+    ---------
+    gid : `int`
+        Group id.
+
+    Returns
+    -------
+    `str`
+        Group name, as shown by `ls -l`.
+    """
+    name = GROUP_NAMES.get(gid)
+    if name is None:
+        try:
+            name = getgrgid(gid).gr_name
+        except KeyError as error:
+            name = str(gid)
+        GROUP_NAMES[gid] = name
+    return name
+
+
+def get_security_context(path):
+    """Get SELinux security context of a node, as shown by `ls -Z`.
+
+    Arguments
+    ---------
+    path : `str`
+        Node's path, not followed if a sym.link.
+
+    Returns
+    -------
+    `str`
+        Security context, or ``'?'`` if node has none (or if filesystem does
+        not support extended attributes).
+    """
+    try:
+        context = getxattr(path, SECURITY_XATTR, follow_symlinks=False)
+    except OSError as error:
+        return "?"
+    return context.rstrip(b'\x00').decode(ENCODING, errors='replace')
+
+
+def ls_quote(path):
+    """Quote a path as `ls -Q` does.
+
+    Arguments
+    ---------
+    path : `pathlib.Path` or `str`
+        Path to quote.
+
+    Returns
+    -------
+    `str`
+        Path enclosed in double quotes, inner ones, backslashes and control
+        characters being escaped.
+    """
+    return f'"{str(path).translate(LS_QUOTE_ESCAPES)}"'
+
+
+def build_ls_output(path, stat_result, user_owner, group_owner, security):
+    """Build a line equivalent to `ls -l -Q -Z --time-style=long-iso` output,
+    without actually running any `ls` command.
+
+    Arguments
+    ---------
+    path : `str`
+        Node's path.
+    stat_result : `os.stat_result`
+        Status of node, sym.link not followed.
+    user_owner : `str`
+        Name of node's user owner.
+    group_owner : `str`
+        Name of node's group owner.
+    security : `str`
+        Node's security context.
+
+    Returns
+    -------
+    `str`
+        `ls` like output line.
+    """
+    mtime = datetime.fromtimestamp(stat_result.st_mtime)
+    ls_output = (
+        f"{filemode(stat_result.st_mode)} {stat_result.st_nlink} "
+        f"{user_owner} {group_owner} {security} {stat_result.st_size} "
+        f"{mtime.strftime(LS_TIME_FORMAT)} {ls_quote(path)}")
+    if S_ISLNK(stat_result.st_mode):
+        try:
+            ls_output += f" -> {ls_quote(readlink(path))}"
+        except OSError as error:
+            pass
+    return ls_output
+
+
 def get_symlink_infos(dir_entry):
     """Get some infos about a symbolic link.
 
@@ -1134,68 +1492,80 @@ def get_symlink_infos(dir_entry):
 
     Returns
     -------
-    :class:`Result` whose :attr:`value` could be a :class:`SymLink`
-        :param:`path` links informations.
+    `tuple` of (:class:`SymLink`, `str`)
+        :param:`path` links informations (or ``None``) and error message
+        (or ``None``).
     """
+    path = dir_entry.entry.path
     try:
-        linked_path = Path(readlink(dir_entry.path))
+        linked_path = readlink(path)
     except PermissionError as error:
         error_msg = (
             f"Sym.Link ``{path}`` is unreadable, asking for its actual linked "
             f"path results in a permission error: {error.strerror}")
-        return Result(error_msg=error_msg)
+        return None, error_msg
     except OSError as error:
         error_msg = (
             f"Sym.Link ``{path}`` is unreadable, asking for its actual linked "
             f"path results in a OSError: {error.strerror}")
-        return Result(error_msg=error_msg)
+        return None, error_msg
 
     # Make linked path absolute
-    if not linked_path.is_absolute():
-        linked_path = dir_entry.path.parent / linked_path
+    if not isabs(linked_path):
+        linked_path = join(dirname(path), linked_path)
 
-    # Try fully resolve linked path
-    linked_abspath = linked_path.resolve()
-    resolved_linked_path = None
-    try:
-        resolved_linked_path = linked_abspath.resolve(strict=True)
-    except FileNotFoundError as error:
-        return Result(SymLink(SymLinkType.broken, linked_abspath))
-    except RuntimeError as error:
-        return Result(SymLink(SymLinkType.circular, linked_abspath))
-
-    # Nominal cases:
-    error_msg = None
+    return get_linked_path_infos(linked_path)
+
+
+@lru_cache(maxsize=LINKED_PATHES_CACHE_SIZE)
+def get_linked_path_infos(linked_path):
+    """Get some infos about path linked by a symbolic link.
+
+    Results are memoized, as many sym.links of a same tree often share
+    their linked paths, which are assumed not to change during a run.
+
+    Arguments
+    ---------
+    linked_path : `str`
+        Absolute, but not resolved, linked path.
+
+    Returns
+    -------
+    `tuple` of (:class:`SymLink`, `str`)
+        :param:`linked_path` informations and error message (or ``None``).
+    """
+    # Follow linked path once, to detect broken or circular sym.links
     try:
-        if linked_abspath.is_symlink():
-            type_ = SymLinkType.symlink
-        elif linked_abspath.is_dir():
-            type_ = SymLinkType.directory
-        elif linked_abspath.is_file():
-            type_ = SymLinkType.file
-        else:
-            type_ = SymLinkType.unkown
-    except PermissionError as error:
-        error_msg = (
-            f"Access to linked path ``{linked_abspath}`` is unreachable, "
-            f"trying to dertermine node's type results in a permission error: "
-            f"{error.strerror}")
+        mode = stat(linked_path).st_mode
     except OSError as error:
+        if error.errno in (ENOENT, ENOTDIR):
+            return SymLink(SymLinkType.broken, linked_path), None
+        elif error.errno == ELOOP:
+            return SymLink(SymLinkType.circular, linked_path), None
+        # else:
         error_msg = (
             f"Access to linked path ``{linked_path}`` is unreachable, trying "
-            f"to dertermine node's type results in an OSerror: "
+            f"to dertermine node's type results in an OSError: "
             f"{error.strerror}")
+        return SymLink(SymLinkType.unknown, linked_path), error_msg
+
+    # Nominal cases: linked path may itself be a sym.link
+    if islink(linked_path):
+        mode = S_IFLNK
+    type_ = SYMLINK_TYPES_BY_FMT.get(S_IFMT(mode), SymLinkType.unknown)
 
-    return Result(SymLink(type_, linked_abspath, resolved_linked_path))
+    return SymLink(type_, linked_path, realpath(linked_path)), None
 
 
-def get_node_infos(dir_entry):
+def get_node_infos(dir_entry, with_ls_output=False):
     """Get some file tree node informations.
 
     Arguments
     ---------
     dir_entry : :class:`DirEntry`
         Item resulting of `_scandir()` on parent path.
+    with_ls_output : `bool`
+        Tell if an `ls -l -Q -Z` like line has also to be built for node.
 
     Returns
     -------
@@ -1204,26 +1574,23 @@ def get_node_infos(dir_entry):
     """
     symlink_value, symlink_type, resolved_symlink_path = (None,) * 3
     error_msgs = []
-    path, type_ = dir_entry.path, dir_entry.type
+    # Path is kept as a `str`, as given by `os.scandir()`
+    path, type_ = dir_entry.entry.path, dir_entry.type
 
     # Ensure node already exists
-    _error_msg = (
-        f"Path ``{path}`` seems to either not exist (any more) or user who "
-        f"launch application has not enough rights to ask for more "
-        f"information about node!")
     try:
-        if not dir_entry.is_path_existing():
-            error_msgs.append(_error_msg)
+        is_path_existing = dir_entry.is_path_existing()
     except PermissionError as error:
-        error_msgs.append(_error_msg)
+        is_path_existing = False
+    if not is_path_existing:
+        error_msgs.append(NOT_EXISTING_PATH_ERROR_MSG.format(path=path))
 
     # Sym.link
     if dir_entry.is_symlink():
-        symlink_result = get_symlink_infos(dir_entry)
-        if symlink_result.has_error():
-            error_msgs.append(symlink_result.error_msg)
-        if symlink_result.has_value():
-            symlink = symlink_result.value
+        symlink, error_msg = get_symlink_infos(dir_entry)
+        if error_msg is not None:
+            error_msgs.append(error_msg)
+        if symlink is not None:
             symlink_value, symlink_type, resolved_symlink_path = \
                 symlink.linked_path, symlink.type, symlink.resolved_linked_path
 
@@ -1238,60 +1605,34 @@ def get_node_infos(dir_entry):
                     f"``{symlink.linked_path}`` is a start of circular "
                     f"reference!")
                 error_msgs.append(error_msg)
-            elif symlink.is_linked_path_unknown():
+            elif symlink.is_linked_path_unknown() and (error_msg is None):
+                # (not repeating any error already reported about it)
                 error_msg = (
                     f"Sym.link value of ``{symlink.linked_path}`` could not "
                     f"be resolved to either a file, a directory or an other "
                     f"sym.link!")
                 error_msgs.append(error_msg)
 
-    # `ls` shell command
-    ls_output, _ls_output, \
-    p_type, perms, links_nb, user_owner, \
-        group_owner, security, size = (None,) * 9
-    ls_cmd = LSD.format(path=path) if dir_entry.is_dir() \
-                                   else LS.format(path=path)
-
-    try:
-        completed_process = run(ls_cmd, shell=True, check=True, stdout=PIPE,
-                                stderr=STDOUT, encoding=ENCODING)
-        _ls_output = completed_process.stdout.rstrip()
-    except CalledProcessError as error:
-        error_msgs.append(f"Failed to run `ls` on ``{path}``: {error.stderr}")
-
-    if _ls_output:
-        match = LS_OUTPUT_REGEX.match(_ls_output)
-        if match is None:
-            ls_output = _ls_output
-            error_msg = \
-                f"Unable to parse output of `ls` command: ``{ls_output}``!"
-            error_msgs.append(error_msg)
-        else:
-            p_type, perms, links_nb, \
-                user_owner, group_owner, \
-                security, size = match.group('p_type', 'p_perms', 'links_nb',
-                                             'user_owner', 'group_owner',
-                                             'security', 'size')
-            # Conversions from string to specific types
-            links_nb = int(links_nb)
-            size = int(size)
-
-            # Check if types are coherents
-            if p_type != type_.as_ls_output_char():
-                error_msg = (
-                    f"Types differ from Python :mod:`os.scandir` result and "
-                    f"output of `ls` command: ``{type_}`` (Python) != "
-                    f"``{p_type}`` (ls)!")
-                error_msgs.append(error_msg)
-
-    # Get (a|m|c)time(s)
+    # Node's status, as `ls -l -Z` would report it
+    links_nb, size, perms, user_owner, group_owner, security, ls_output = \
+        (None,) * 7
     atime, mtime, ctime = (None,) * 3
     try:
-        atime = getatime(path)
-        mtime = getmtime(path)
-        ctime = getctime(path)
+        stat_result = dir_entry.stat()
     except OSError as error:
-        error_msgs.append("Unable to retrieve either atime, mtime and/or ctime!")
+        error_msgs.append(
+            f"Unable to get status of ``{path}`` node: {error.strerror}")
+    else:
+        links_nb, size = stat_result.st_nlink, stat_result.st_size
+        perms = filemode(stat_result.st_mode)[1:]
+        user_owner = get_user_name(stat_result.st_uid)
+        group_owner = get_group_name(stat_result.st_gid)
+        security = get_security_context(path)
+        atime, mtime, ctime = \
+            stat_result.st_atime, stat_result.st_mtime, stat_result.st_ctime
+        if with_ls_output:
+            ls_output = build_ls_output(path, stat_result, user_owner,
+                                        group_owner, security)
 
     return NodeInfos(path, type_,
                      links_nb=links_nb, size=size,
@@ -1320,23 +1661,19 @@ def get_node_content_checksum(node_infos, algorithm=DEFAULT_CHECKSUM_ALGORITHM):
 
     Returns
     -------
-    :class:`Result` with value as `str`
-        MD5 sum hash as hexadecimal digest if node is an actual file and
-        reading its content was possible; ``None`` otherwise.
+    `tuple` of (`str`, `str`)
+        Checksum hash as hexadecimal digest if node is an actual file and
+        reading its content was possible (``None`` otherwise), and error
+        message (or ``None``).
     """
     if not node_infos.is_path_existing():
         error_msg = (
             f"Node's filepath ``{node_infos.path}`` does not point to a valid "
             f"file anymore (detected when trying to compute its checksum)!")
-        return Result(error_msg=error_msg)
-    # else:
-
-    file_content_result = read_file_content(node_infos.path)
-    if file_content_result.has_error():
-        return Result(error_msg=file_content_result.error_msg)
+        return None, error_msg
     # else:
 
-    return Result(checksum(file_content_result.value, algorithm))
+    return file_checksum(node_infos.path, algorithm)
 
 
 def process_dir_entry(dir_entry, options):
@@ -1360,19 +1697,66 @@ def process_dir_entry(dir_entry, options):
         Node's metadata, or ``None`` if its path has to be excluded as set
         in :param:`options`.
     """
-    node_infos = get_node_infos(dir_entry)
+    node_infos = get_node_infos(dir_entry, options.ls_output)
 
     algorithm = options.checksum
     if algorithm and node_infos.is_file():
-        checksum_result = get_node_content_checksum(node_infos, algorithm)
-        if checksum_result.has_error():
-            node_infos.add_error_msg(checksum_result.error_msg)
+        checksum_, error_msg = get_node_content_checksum(node_infos, algorithm)
+        if error_msg is not None:
+            node_infos.add_error_msg(error_msg)
         else:
-            node_infos.add_checksum(algorithm, checksum_result.value)
+            node_infos.add_checksum(algorithm, checksum_)
+            if RATE_LIMITER is not None:
+                RATE_LIMITER.consume(node_infos.size_value)
 
     return node_infos
 
 
+def process_dir_entries(dir_entries, options):
+    """Process some nodes' pathes, concurrently if more than one job is set.
+
+    Each node is followed by a random sleep time, as set in :param:`options`.
+
+    Arguments
+    ---------
+    dir_entries : `list` of :class:`DirEntry`
+        Directory entries to process.
+    options : :class:`Options`
+        Current application options.
+
+    Yields
+    ------
+    `NodeInfos`
+        Nodes' metadata, in same order than :param:`dir_entries`.
+    """
+    is_sleep_enabled = options.is_sleep_enabled
+    get_random_sleep_time = options.get_random_sleep_time
+    if EXECUTOR is None:
+        for dir_entry in dir_entries:
+            yield process_dir_entry(dir_entry, options)
+            if is_sleep_enabled:
+                sleep(get_random_sleep_time())
+        return
+    # else:
+
+    # Only submit a few nodes ahead of yielded ones, so that an interrupted
+    # run has not to wait for a whole directory to be processed; sleep
+    # here, after each yielded node, rather than in pool's threads, which
+    # would otherwise be waited for when exiting
+    max_pending = 2 * options.jobs
+    pending = PENDING_FUTURES
+    for dir_entry in dir_entries:
+        pending.append(EXECUTOR.submit(process_dir_entry, dir_entry, options))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+            if is_sleep_enabled:
+                sleep(get_random_sleep_time())
+    while pending:
+        yield pending.popleft().result()
+        if is_sleep_enabled:
+            sleep(get_random_sleep_time())
+
+
 def _scandir(dir_entry, options):
     """Scan a given directory and sort its entries by types and names.
 
@@ -1386,40 +1770,38 @@ def _scandir(dir_entry, options):
     Returns
     -------
     :class:`DirEntries`
-        Directory entries, as :class:`DirEntry`, sorted by types and names.
+        Directory entries, as :class:`DirEntry`, sorted by types and names;
+        excluded entries are only given by their paths, as `str`.
     """
     dirs, files, links, excluded, unknowns = ([], [], [], [], [])
+    entries_by_type = {
+        NodeType.directory: dirs,
+        NodeType.file: files,
+        NodeType.symlink: links,
+    }
+    is_path_excluded = options.is_path_excluded
     parent_dirpath = dir_entry.path
 
     try:
         with scandir(parent_dirpath) as dir_entries:
             for dir_entry in dir_entries:
-                dir_entry = DirEntry(parent_dirpath, dir_entry, options)
-
-                if dir_entry.is_excluded():
-                    excluded.append(dir_entry)
-                elif dir_entry.is_symlink():
-                    links.append(dir_entry)
-                elif dir_entry.is_dir():
-                    dirs.append(dir_entry)
-                elif dir_entry.is_file():
-                    files.append(dir_entry)
-                elif dir_entry.is_type_unknown():
-                    unknowns.append(dir_entry)
-                else:
-                    dir_entry.set_type(NodeType.unknown)
-                    unknowns.append(dir_entry)
+                # Only wrap entries which are not to be excluded
+                if is_path_excluded(dir_entry.path):
+                    excluded.append(dir_entry.path)
+                    continue
+                # else:
+                dir_entry = DirEntry(dir_entry)
+                entries_by_type.get(dir_entry.type, unknowns).append(dir_entry)
     except OSError as error:
         LOGGER.error((
             f"Failed to run `os.scandir()` on ``{parent_dirpath}`` path! Get "
             f"following error message: {error.strerror}"))
         pass
 
-    dirs = sorted(dirs, key=lambda entry: entry.name)
-    files = sorted(files, key=lambda entry: entry.name)
-    links = sorted(links, key=lambda entry: entry.name)
     # No need to sort excluded entries!
-    unknowns = sorted(unknowns, key=lambda entry: entry.name)
+    for entries in (dirs, files, links, unknowns):
+        if len(entries) > 1:
+            entries.sort(key=attrgetter('name'))
 
     return DirEntries(dirs, files, links, excluded, unknowns)
 
@@ -1433,6 +1815,9 @@ def walk(dir_entry, options):
         then symlinks, then excluded entries and last unknown typed entries;
     #.  by their names then.
 
+    Each subdirectory is then walked the same way, depth first, once all
+    entries of its parent were walked.
+
     Arguments
     ---------
     dir_entry : :class:`DirEntry`
@@ -1443,57 +1828,115 @@ def walk(dir_entry, options):
     Yields
     ------
     `iterable` of `NodeInfos`
-        List of output of shell command `ls` on walked paths as constructed
-        `Node` instances.
+        Metadata of walked paths, as constructed `NodeInfos` instances.
     """
+    # Only build log messages if they will actually be emitted
+    is_info_logged = LOGGER.isEnabledFor(INFO)
+    is_sleep_enabled = options.is_sleep_enabled
+    get_random_sleep_time = options.get_random_sleep_time
+
     # Ensure current dir. path is not to be excluded before processing it
     if dir_entry.is_excluded():
-        LOGGER.info((f"  Not scanning ``{options.get_path(dir_path)}/``: "
-                     f"directory path has to be excluded..."))
-        return []
+        if is_info_logged:
+            LOGGER.info((f"  Not scanning "
+                         f"``{options.get_path(dir_entry.path)}/``: "
+                         f"directory path has to be excluded..."))
+        return
     # else:
 
-    LOGGER.info((f"  Start scanning ``{options.get_path(dir_entry.path)}/`` "
-                 "directory..."))
+    # Directories still to walk, next one on top
+    dirs_stack = [dir_entry]
+    while dirs_stack:
+        dir_entry = dirs_stack.pop()
+
+        if is_info_logged:
+            LOGGER.info((f"  Start scanning "
+                         f"``{options.get_path(dir_entry.path)}/`` "
+                         f"directory..."))
+
+        _dir_entries = _scandir(dir_entry, options)
+        dir_entries, file_entries, link_entries, \
+        excluded_entries, unknown_entries = \
+            _dir_entries.directories, _dir_entries.files, _dir_entries.links, \
+            _dir_entries.excluded, _dir_entries.unknowns
+
+        # Scan directories first; no need to sleep after them, as their
+        # content is not read
+        for subdir_entry in dir_entries:
+            yield process_dir_entry(subdir_entry, options)
+
+        # Scan files second, then symlinks
+        yield from process_dir_entries(file_entries + link_entries, options)
+
+        # Log and yield each of excluded entries
+        for excluded_path in excluded_entries:
+            if is_info_logged:
+                LOGGER.info((f"  Not asking more infos about "
+                             f"``{options.get_path(excluded_path)}``: "
+                             f"path has to be excluded..."))
+            yield NodeInfos(excluded_path, NodeType.excluded)
+
+        # Log and yield all unknown entries ?!
+        for unknown_entry in unknown_entries:
+            LOGGER.warning((f"  Node at "
+                            f"``{options.get_path(unknown_entry.path)}`` path "
+                            f"could create some problems: its file type (from "
+                            f"`lstat()`) is neither a directory, a file nor a "
+                            f"sym.link, or could not be retrieved, and so is "
+                            f"currently unknown..."))
+            yield process_dir_entry(unknown_entry, options)
+            if is_sleep_enabled:
+                sleep(get_random_sleep_time())
+
+        # Last, walk inside each subdirectory nodes, in their order
+        dirs_stack.extend(reversed(dir_entries))
+
+
+def iter_in_thread(iterable, maxsize=NODES_QUEUE_SIZE):
+    """Iterate over an iterable, consumed ahead by a separate thread.
+
+    This lets, for example, next nodes be walked while current ones are
+    written.
 
-    _dir_entries = _scandir(dir_entry, options)
-    dir_entries, file_entries, link_entries, \
-    excluded_entries, unknown_entries = \
-        _dir_entries.directories, _dir_entries.files, _dir_entries.links, \
-        _dir_entries.excluded, _dir_entries.unknowns
+    Arguments
+    ---------
+    iterable : `iterable`
+        Iterable to consume, in a separate daemon thread.
+    maxsize : `int`
+        Maximum number of items consumed ahead of yielded ones.
 
-    # Scan directories first
-    subdir_entries = []
-    for dir_entry in dir_entries:
-        node = process_dir_entry(dir_entry, options)
-        subdir_entries.append(dir_entry)
-        yield node
-        sleep(options.get_random_sleep_time())
-
-    # Scan files second, then symlinks
-    for node_entry in (file_entries + link_entries):
-        yield process_dir_entry(node_entry, options)
-        sleep(options.get_random_sleep_time())
-
-    # Log and yield each of excluded entries
-    for dir_entry in excluded_entries:
-        LOGGER.info((f"  Not asking more infos about "
-                     f"``{options.get_path(dir_entry.path)}``: path has to be "
-                     f"excluded..."))
-        yield NodeInfos(dir_entry.path, dir_entry.type)
-
-    # Log and yield all unknown entries ?!
-    for dir_entry in unknown_entries:
-        LOGGER.warning((f"  Node at ``{options.get_path(dir_entry.path)}`` "
-                        f"path could create some problems: its type could not "
-                        f"be asked by `os.DirEntry.is_*()` methods, and so is "
-                        f"currently unknown..."))
-        yield process_dir_entry(dir_entry, options)
-        sleep(options.get_random_sleep_time())
-
-    # Last, recursively walk inside each subdirectory nodes
-    for subdir_entry in subdir_entries:
-        yield from walk(subdir_entry, options)
+    Raises
+    ------
+    `Exception`
+        Any exception raised while consuming :param:`iterable`.
+
+    Yields
+    ------
+    `object`
+        Items of :param:`iterable`, in same order.
+    """
+    queue = Queue(maxsize)
+    end = object()
+
+    def consume():
+        try:
+            for item in iterable:
+                queue.put((item, None))
+        except Exception as error:
+            queue.put((end, error))
+        else:
+            queue.put((end, None))
+
+    Thread(target=consume, daemon=True).start()
+
+    while True:
+        item, error = queue.get()
+        if item is end:
+            break
+        yield item
+
+    if error is not None:
+        raise error
 
 
 # CLI  ----------------------------------------------------------------------
@@ -1521,7 +1964,7 @@ def create_args_parser():
                             f"{DEFAULT_MIN_TIME_SLEEP:.3f},"
                             f"{DEFAULT_MAX_TIME_SLEEP:.3f}"),
                         help=("Time interval based on which randomly sleep, "
-                              "between two concsecutive `ls` commands on "
+                              "between two concsecutive nodes analysis on "
                               "*file* (not directories). Time values are "
                               "expresses in seconds, with optional decimal "
                               "parts. Default to "
@@ -1530,8 +1973,8 @@ def create_args_parser():
                               "If you explicitely desire no sleep time, "
                               "option must be set to ``0,0``."))
     parser.add_argument('-o', '--output',
-                        help=("Output CSV filepath where store results of "
-                              "`ls` command traversing files tree. "
+                        help=("Output CSV filepath where store metadata "
+                              "collected traversing files tree. "
                               "If not set, `stdout` will be used instead."))
     parser.add_argument('-l', '--log', nargs='?', const='<OUTPUT>.log',
                         help=("Tell if a log file will be used in addition of "
@@ -1546,10 +1989,30 @@ def create_args_parser():
                               "one). Script will try to convert pathes if this "
                               "is possible; else, or if option is not set, "
                               "all pathes will be absolute."))
-    parser.add_argument('-c', '--checksum', nargs='?', choices=['md5'],
+    parser.add_argument('-c', '--checksum', nargs='?',
+                        choices=sorted(HASH_FUNCTIONS),
                         default=None, const=DEFAULT_CHECKSUM_ALGORITHM,
                         help=("Set walker to also compute a checksum for each "
-                              "encountered file, and which algorithm to use."))
+                              "encountered file, and which algorithm to use. "
+                              "Default to "
+                              f"``{DEFAULT_CHECKSUM_ALGORITHM}`` if option is "
+                              "used as a flag, which is hardware-accelerated "
+                              "by OpenSSL on CPUs with SHA extensions."))
+    parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_JOBS,
+                        help=("Number of files and sym.links analysed "
+                              "concurrently, each by its own thread, within "
+                              "a same directory (directories are still "
+                              "walked one by one). Default to "
+                              f"``{DEFAULT_JOBS}``."))
+    parser.add_argument('--max-mbps', type=float, default=None,
+                        help=("Maximum rate, in MiB per second, at which "
+                              "files contents are read for computing their "
+                              "checksum (see `--checksum` option). Default "
+                              "to no limit."))
+    parser.add_argument('--ls-output', action='store_true',
+                        help=("Also store, for each node, a line alike to "
+                              "`ls -l -Q -Z` output, built from collected "
+                              "metadata (no `ls` command is actually run)."))
     parser.add_argument('pathes', nargs='*',
                         help="Pathes to walk. If not set, default to `.`.")
     return parser
@@ -1590,24 +2053,15 @@ def configure_logging(logfile_path=None, encoding=ENCODING,
     level : `int`
         Minimum logging level for both logger and handlers.
     """
-    # Create formatters
-    stderr_formatter = \
-        Formatter(fmt='%(asctime)s %(levelname)s: %(message)s',
-                  datefmt="%H:%M:%S")
-    if logfile_path:
-        logfile_formatter = \
-            Formatter(fmt='%(asctime)s - %(levelname)s - %(message)s',
-                      datefmt="%Y-%m-%d %H:%M:%S")
-
     # Create handlers
     stderr_handler = StreamHandler(stream=stderr)
     stderr_handler.setLevel(level)
-    stderr_handler.setFormatter(stderr_formatter)
+    stderr_handler.setFormatter(STDERR_FORMATTER)
     if logfile_path:
         logfile_handler = FileHandler(logfile_path, mode='ta',
                                       encoding=encoding)
         logfile_handler.setLevel(level)
-        logfile_handler.setFormatter(logfile_formatter)
+        logfile_handler.setFormatter(LOGFILE_FORMATTER)
 
     # Configure main loader
     LOGGER.addHandler(stderr_handler)
@@ -1636,36 +2090,43 @@ def extend_excluded(excluded, script_path, excluded_relative_to,
 
     Returns
     -------
-    `list` of regexp. objects
+    `list` of `str` and `tuple` of (`str`, regexp. object)
         New list of excluded patterns, enhanced with :param:`script_path` and
-        :param:`output_path`.
+        :param:`output_path`: exact paths to exclude as `str`, and
+        directories to exclude with all of their children as their path
+        (a prefix of all of these) with regexp. object.
     """
-    _excluded = []
-
-    # Transform any path in absolute path as `str`
-    for path in excluded:
-        if not path.startswith('/'):
-            path = join(excluded_relative_to, path)
-        _excluded.append(path)
-
-    # Append current paths to excluded list
-    _excluded.append(str(script_path))
+    # Append current paths to excluded ones
+    pathes = list(excluded)
+    pathes.append(str(script_path))
     if output_path:
-        _excluded.append(str(output_path))
+        pathes.append(str(output_path))
     if logfile_path:
-        _excluded.append(str(logfile_path))
+        pathes.append(str(logfile_path))
 
-    # Transform path in regex objects
+    # Transform, in a single pass, each path into an absolute one as `str`,
+    # and directories ones in regex objects
     excluded = []
-    for path in _excluded:
+    for path in pathes:
         is_path_dir = path.endswith('/')
-        path = escape(str(Path(path).resolve()))
-        if is_path_dir:
-            # Exclude both dirpath (without its optional slash) and
-            # all of its children. Note that previous leading slash was stripped
-            # Path.resolve transformation.
-            path += '(/.*)?'
-        excluded.append(compile_(f"^{path}$"))
+        # Resolve sym.links of parent directories, as walked paths are
+        # resolved too (this costs a few syscalls, but only once per run);
+        # excluded node itself is kept as is, being never followed by walk
+        path = abspath(join(excluded_relative_to, path))
+        path = join(realpath(dirname(path)), basename(path))
+        if not is_path_dir:
+            # Literal path: no need of any regexp.
+            excluded.append(path)
+            continue
+        # else:
+
+        # Exclude both dirpath (without its optional slash) and
+        # all of its children. Note that previous leading slash was stripped
+        # by `abspath()` normalization.
+        pattern = escape(path) + '(/.*)?'
+        # Patterns are meant to be `fullmatch()`-ed, hence not anchored; let
+        # `.` also match any newline a child name could contain
+        excluded.append((path, compile_(pattern, ASCII | DOTALL)))
 
     return excluded
 
@@ -1699,7 +2160,7 @@ def prepare_options(parsed_cli_args):
                        f"valid float numbers; passed values were: "
                        f"[{sleep_parts[0]}, {sleep_parts[1]}]."))
     if min_sleep_time > max_sleep_time:
-        min_slee_time, max_sleep_time = max_sleep_time, min_sleep_time
+        min_sleep_time, max_sleep_time = max_sleep_time, min_sleep_time
 
     # Pathes to walk
     pathes = ["."] if (parsed_cli_args.pathes is None) \
@@ -1711,13 +2172,28 @@ def prepare_options(parsed_cli_args):
         except FileNotFoundError as error:
             exit_on_error(f"Unable to reach ``{path}`` path to scan!")
 
+    # Number of concurrent jobs
+    jobs = parsed_cli_args.jobs
+    if jobs < 1:
+        exit_on_error((f"`--jobs` option must be set to at least 1; value "
+                       f"passed here is ``{jobs}``!"))
+
+    # Maximum rate of files contents read
+    max_mbps = parsed_cli_args.max_mbps
+    if (max_mbps is not None) and (max_mbps <= 0):
+        exit_on_error((f"`--max-mbps` option must be strictly positive; "
+                       f"value passed here is ``{max_mbps}``!"))
+    if (max_mbps is not None) and (parsed_cli_args.checksum is None):
+        exit_on_error((f"CLI option `--max-mbps` could only be used if "
+                       f"`--checksum` is also set, as files contents are "
+                       f"only read for computing their checksum!"))
+
     # Nodes' pathes relative to
     pathes_relative_to = None
-    if ('pathes_relative_to' in parsed_cli_args) \
-            and (parsed_cli_args.pathes_relative_to is not None):
+    if parsed_cli_args.pathes_relative_to is not None:
         _pathes_relative_to = parsed_cli_args.pathes_relative_to
         if _pathes_relative_to == "<HOME>":
-            pathes_relative_to = Path.home()
+            pathes_relative_to = Path.home().resolve()
         elif _pathes_relative_to == "<WALKED>":
             if len(pathes_to_walk) > 1:
                 exit_on_error((f"--pathes-relative-to option could only be "
@@ -1732,16 +2208,14 @@ def prepare_options(parsed_cli_args):
                            f"``{pathes_relative_to}`` seems to not exists!"))
 
     # Manage output
-    output_path = None if (('output' not in parsed_cli_args)
-                            or (parsed_cli_args.output is None)) \
+    output_path = None if (parsed_cli_args.output is None) \
                        else Path(parsed_cli_args.output).resolve()
-    if output_path and Path(output_path).resolve().exists():
+    if output_path and output_path.exists():
         exit_on_error((f"Output filepath ``{output_path}`` already exists: "
                        f"could not write in it!"))
 
     # Manage additional log, if any
-    logfile_path = None if ('log' not in parsed_cli_args) \
-                        else parsed_cli_args.log
+    logfile_path = parsed_cli_args.log
     if logfile_path == '<OUTPUT>.log':
         if output_path is None:
             exit_on_error((
@@ -1761,7 +2235,7 @@ def prepare_options(parsed_cli_args):
     #   Excluded pathes relative to
     _excluded_relative_to = parsed_cli_args.excluded_relative_to
     if _excluded_relative_to == "<HOME>":
-        excluded_relative_to = Path.home()
+        excluded_relative_to = Path.home().resolve()
     elif _excluded_relative_to == "<WALKED>":
         if len(pathes_to_walk) > 1:
             exit_on_error((f"--excluded-relative-to option could only be "
@@ -1773,8 +2247,10 @@ def prepare_options(parsed_cli_args):
         excluded_relative_to = Path(_excluded_relative_to).resolve()
 
     #   Construct list of pathes to exclude
-    excluded = [] if ("exclude" not in parsed_cli_args) \
-                    else set(parsed_cli_args.exclude.split(','))
+    #   (skipping empty ones, which would otherwise exclude walked path)
+    excluded = [] if (parsed_cli_args.exclude is None) \
+                  else {path for path in parsed_cli_args.exclude.split(',')
+                        if path}
     excluded = extend_excluded(excluded, script_path=APP_RUN_INFOS.script_path,
                                excluded_relative_to=excluded_relative_to,
                                output_path=output_path,
@@ -1786,7 +2262,9 @@ def prepare_options(parsed_cli_args):
                    pathes_relative_to=pathes_relative_to,
                    output_path=output_path, logfile_path=logfile_path,
                    excluded=excluded, excluded_relative_to=excluded_relative_to,
-                   checksum=parsed_cli_args.checksum)
+                   checksum=parsed_cli_args.checksum,
+                   ls_output=parsed_cli_args.ls_output, jobs=jobs,
+                   max_mbps=max_mbps)
 
 
 def log_infos(options):
@@ -1810,12 +2288,16 @@ def log_infos(options):
                  f"[{options.min_sleep_time:.3f}, "
                  f"{options.max_sleep_time:.3f}]"))
     LOGGER.info(f"- checksum algorithm to use, if any: {options.checksum}")
+    LOGGER.info(f"- build `ls` like output: {options.ls_output}")
+    LOGGER.info(f"- number of concurrent jobs: {options.jobs}")
+    LOGGER.info((f"- maximum rate of checksummed contents (in MiB/s), if "
+                 f"any: {options.max_mbps}"))
     LOGGER.info(f"- set pathes relative to: `{options.pathes_relative_to}`")
     LOGGER.info(f"- output of scan file: `{options.output_path}`")
     LOGGER.info(f"- additional log file: `{options.logfile_path}`")
     LOGGER.info(f"- set excluded pathes relative to: `{options.excluded_relative_to}`")
 
-    excluded_patterns = options.excluded_patterns
+    excluded_patterns = options.excluded_pathes + list(options.excluded_patterns)
     if len(excluded_patterns) == 0:
         LOGGER.info(f"- excluded path patterns are: []")
     else:
@@ -1824,12 +2306,63 @@ def log_infos(options):
             LOGGER.info(f'  - ``{excluded_pattern}``')
 
 
+def write_output_rows():
+    """Write, then flush, rows still pending in CSV output of current run.
+
+    Returns
+    -------
+    `str` or ``None``
+        Error message, if function call encountered some error.
+    """
+    if (OUTPUT_WRITER is None) or (not OUTPUT_ROWS):
+        return None
+    # else:
+
+    # Take pending rows out first, and block handled signals while writing
+    # and flushing them: a stop signal handler, itself writing pending rows, could
+    # otherwise write some of them twice
+    rows = OUTPUT_ROWS[:]
+    OUTPUT_ROWS.clear()
+    previous_mask = pthread_sigmask(SIG_BLOCK,
+                                    [signo for signo, _ in SIGNALS])
+    try:
+        error_msg = write_rows(OUTPUT_WRITER, rows)
+        if error_msg is None:
+            error_msg = flush_output_file(OUTPUT_FILE)
+    finally:
+        pthread_sigmask(SIG_SETMASK, previous_mask)
+
+    return error_msg
+
+
+def close_output():
+    """Write pending rows, flush and close CSV output of current run, if
+    still opened.
+    """
+    global OUTPUT_FILE, OUTPUT_WRITER
+    write_output_rows()
+    OUTPUT_WRITER = None
+    if OUTPUT_FILE is not None:
+        close_output_file(OUTPUT_FILE)
+        OUTPUT_FILE = None
+
+
 def app_exit(return_code=0):
     """Exit current application run.
     """
     now = datetime.now()
     timedelta = now - APP_RUN_INFOS.start_datetime
 
+    if EXECUTOR is not None:
+        # Cancel nodes not yet processed, as pool's threads are joined
+        # when interpreter exits
+        for future in list(PENDING_FUTURES):
+            future.cancel()
+        EXECUTOR.shutdown(wait=False)
+    if RATE_LIMITER is not None:
+        RATE_LIMITER.stop()
+    close_output()
+
     LOGGER.critical(f"Process terminating at {now.isoformat(' ')}!")
     LOGGER.info((
         f"Script has run {timedelta} from "
@@ -1841,8 +2374,10 @@ def app_exit(return_code=0):
 def stop_signal_handler(signal=None, frame=None):
     """Handler for all signals terminating current application run.
     """
+    signal_name = next(
+        (name for signo, name in SIGNALS if signo == signal), None)
     LOGGER.critical((f"Process receiving ``{signal}`` (i.e. "
-                     f"``{SIGNALS[signal]}``) signal (or keyboard Ctrl+C "
+                     f"``{signal_name}``) signal (or keyboard Ctrl+C "
                      f"interrupt)!"))
     app_exit(2)
 
@@ -1851,18 +2386,36 @@ def _main(options):
     """Core function of Main function.
     """
     # Register stop signal handler
-    for _signal in SIGNALS.keys():
+    for _signal, _ in SIGNALS:
         signal(_signal, stop_signal_handler)
 
+    # Create pool of threads processing nodes, if needed
+    global EXECUTOR
+    if options.jobs > 1:
+        EXECUTOR = ThreadPoolExecutor(max_workers=options.jobs)
+
+    # Limit rate of files contents read, if needed
+    global RATE_LIMITER
+    if options.max_mbps is not None:
+        RATE_LIMITER = RateLimiter(options.max_mbps * (1 << 20))
+
+    # Open output once for all
+    global OUTPUT_FILE, OUTPUT_WRITER
+    output_file, error_msg = open_output_file(options.output_path, ENCODING)
+    if error_msg is not None:
+        app_exit(1)
+    OUTPUT_FILE = output_file
+    OUTPUT_WRITER = new_csv_writer(output_file)
+
     # Walk tree and print dir. entries metadata:
-    write_result = write_new_line(options.output_path, ENCODING,
-                                  NodeInfos.colstocsv())
-    if write_result.has_error():
+    error_msg = write_rows(OUTPUT_WRITER, [NodeInfos.columns(options.checksum)])
+    if error_msg is not None:
         app_exit(1)
 
-    #   Process node(s)
+    #   Process node(s), writing their rows by batches
     pathes_relative_to = options.pathes_relative_to
-    output_path = options.output_path
+    checksum_algorithm = options.checksum
+    rows = OUTPUT_ROWS
 
     try:
         for path in options.walked_pathes:
@@ -1882,20 +2435,21 @@ def _main(options):
             # else:
 
             if not dir_entry.is_dir():
-                node_infos = process_dir_entry(dir_entry, options)
-                write_result = write_new_line(output_path, ENCODING,
-                                              node_infos.tocsv(pathes_relative_to))
-                if write_result.has_error():
-                    app_exit(1)
+                nodes_infos = (process_dir_entry(dir_entry, options),)
             else:  # dir_entry.is_dir()
                 # Nominal case of a directory:
-                for node_infos in walk(dir_entry, options):
-                    write_result = write_new_line(output_path, ENCODING,
-                                                  node_infos.tocsv(pathes_relative_to))
-                    if write_result.has_error():
+                nodes_infos = iter_in_thread(walk(dir_entry, options))
+
+            for node_infos in nodes_infos:
+                rows.append(
+                    node_infos.to_row(pathes_relative_to, checksum_algorithm))
+                if len(rows) >= OUTPUT_ROWS_BATCH_SIZE:
+                    error_msg = write_output_rows()
+                    if error_msg is not None:
                         app_exit(1)
 
-            sleep(options.get_random_sleep_time())
+            if (not dir_entry.is_dir()) and options.is_sleep_enabled:
+                sleep(options.get_random_sleep_time())
     except KeyboardInterrupt as error:
         stop_signal_handler()
 
@@ -1919,7 +2473,11 @@ def main():
     # Walk tree and print dir. entries metadata:
     LOGGER.info(f"Start scanning...")
 
-    _main(options)
+    try:
+        _main(options)
+    finally:
+        # Never lose buffered output, even on unexpected error
+        close_output()
 
     # End of run!
     LOGGER.critical("Stop scanning: job finished normally!")